@@ -1,15 +1,25 @@
+import functools
 import os
 import shutil
 import logging
+import logging.handlers
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-# Configure logging
+# Configure logging. Per-file log records are buffered in memory and
+# flushed to the log file in batches instead of hitting the disk on every
+# message; errors flush immediately, and logging.shutdown() flushes the
+# rest at exit.
+_file_handler = logging.FileHandler('file_organizer.log')
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('file_organizer.log'),
+        logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=_file_handler
+        ),
         logging.StreamHandler()
     ]
 )
@@ -29,28 +39,91 @@ FILE_CATEGORIES = {
     'Others': []  # For unknown extensions
 }
 
+# Flat extension -> category lookup built once at import time.
+# setdefault keeps the first category listed for an extension (e.g. 'csv'
+# stays in Documents), matching the old linear scan.
+_EXT_TO_CATEGORY = {}
+for _cat, _exts in FILE_CATEGORIES.items():
+    for _ext in _exts:
+        _EXT_TO_CATEGORY.setdefault(_ext, _cat)
+_CATEGORY_NAMES = frozenset(FILE_CATEGORIES)
 
+
+@functools.lru_cache(maxsize=256)
 def get_category(extension: str) -> str:
     """Determine the file category based on its extension
 
+    Batches tend to contain runs of the same few extensions, so the
+    result is memoized and repeat lookups skip re-hashing the string.
+
     Args:
-        extension: File extension without the dot
+        extension: Lowercase file extension without the dot
 
     Returns:
         Category name or 'Others' if not found
     """
-    for category, extensions in FILE_CATEGORIES.items():
-        if extension.lower() in extensions:
-            return category
-    return 'Others'
+    return _EXT_TO_CATEGORY.get(extension, 'Others')
+
+
+def scandir_walk(top: str):
+    """Walk a directory tree top-down using os.scandir
+
+    Works like os.walk but yields DirEntry objects, so callers get
+    entry type info without the extra stat syscalls os.walk performs.
+    The yielded subdirectory list can be pruned in place to skip
+    descending into unwanted folders, just like os.walk.
+
+    Args:
+        top: Root directory to walk
+
+    Yields:
+        Tuples of (root, subdir_entries, file_entries)
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.error(f"❌ Cannot scan directory {top}: {e}")
+        return
+
+    subdirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    files = [entry for entry in entries if not entry.is_dir(follow_symlinks=False)]
+
+    yield top, subdirs, files
+
+    # Iterated after the yield so callers can prune subdirs in place
+    for subdir in subdirs:
+        yield from scandir_walk(subdir.path)
+
+
+def _move_file(src: str, dest: str) -> None:
+    """Move a file, taking the single-syscall rename fast path
+
+    Destinations are subfolders of the source directory, so they are on
+    the same filesystem and os.rename almost always succeeds. shutil.move
+    remains as the fallback for cross-device moves.
+
+    Args:
+        src: Source file path
+        dest: Destination file path
+    """
+    try:
+        os.rename(src, dest)
+    except OSError:
+        shutil.move(src, dest)
 
 
-def organize_files(directory: str, dry_run: bool = False) -> dict:
+def organize_files(directory: str, dry_run: bool = False, entries: list = None,
+                   max_workers: int = None) -> dict:
     """Organize files in the specified directory
 
     Args:
         directory: Path of the directory to organize
         dry_run: If True, only shows what would be done without making changes
+        entries: Pre-scanned os.DirEntry list for the directory. If None,
+            the directory is scanned here.
+        max_workers: Number of threads used to move files in parallel.
+            Defaults to min(32, cpu_count * 4).
 
     Returns:
         Dictionary with operation statistics
@@ -61,24 +134,50 @@ def organize_files(directory: str, dry_run: bool = False) -> dict:
 
     logger.info(f"🚀 Starting organization of: {directory}")
 
-    # Create category directories if they don't exist
+    # Create category directories if they don't exist. os.mkdir raises
+    # FileExistsError when the folder is already there, so no stat syscall
+    # is needed to check first.
+    if not dry_run:
+        for category in FILE_CATEGORIES:
+            category_path = os.path.join(directory, category)
+            try:
+                os.mkdir(category_path)
+                logger.info(f"📁 Created category folder: {category}")
+            except FileExistsError:
+                pass
+
+    # Track existing names per category folder so duplicate checks are
+    # in-memory lookups instead of one stat syscall per candidate name
+    existing_names = {}
     for category in FILE_CATEGORIES:
         category_path = os.path.join(directory, category)
-        if not dry_run and not os.path.exists(category_path):
-            os.makedirs(category_path, exist_ok=True)
-            logger.info(f"📁 Created category folder: {category}")
-
-    # Process files in the directory
-    for filename in os.listdir(directory):
-        file_path = os.path.join(directory, filename)
+        try:
+            with os.scandir(category_path) as it:
+                existing_names[category] = {entry.name for entry in it}
+        except FileNotFoundError:
+            existing_names[category] = set()
+
+    # Process files in the directory (scandir gives entry type info
+    # without an extra stat per file)
+    if entries is None:
+        with os.scandir(directory) as it:
+            entries = list(it)
+
+    # First pass: resolve categories and destination names sequentially so
+    # duplicate handling stays race-free, collecting the moves to perform
+    moves = []
+    for entry in entries:
+        filename = entry.name
+        file_path = entry.path
 
         # Skip directories and the log file
-        if os.path.isdir(file_path) or filename == 'file_organizer.log':
+        if entry.is_dir(follow_symlinks=False) or filename == 'file_organizer.log':
             continue
 
-        # Get file extension
-        _, extension = os.path.splitext(filename)
-        extension = extension[1:]  # Remove the dot
+        # Get file extension (rpartition is cheaper than os.path.splitext
+        # in this hot loop; an empty separator means no extension)
+        _, sep, extension = filename.rpartition('.')
+        extension = extension.lower() if sep else ''
 
         # Determine category
         category = get_category(extension)
@@ -88,31 +187,48 @@ def organize_files(directory: str, dry_run: bool = False) -> dict:
             category = 'Others'
             logger.warning(f"⚠️ No extension found for file: {filename}")
 
-        # Build destination path
-        dest_path = os.path.join(directory, category, filename)
-
-        # Handle duplicate files
-        counter = 1
-        while os.path.exists(dest_path):
+        # Handle duplicate files entirely in memory: the pre-scanned name
+        # sets turn collision resolution into dict/set lookups, so the
+        # common no-collision case costs a single membership test
+        new_filename = filename
+        if filename in existing_names[category]:
             base, ext = os.path.splitext(filename)
+            counter = 1
+            while f"{base}_{counter}{ext}" in existing_names[category]:
+                counter += 1
             new_filename = f"{base}_{counter}{ext}"
-            dest_path = os.path.join(directory, category, new_filename)
-            counter += 1
 
-        # Move the file (or simulate in dry run)
+        existing_names[category].add(new_filename)
+        dest_path = os.path.join(directory, category, new_filename)
+
         if dry_run:
             logger.info(f"📋 [DRY RUN] Would move: {filename} -> {category}/")
+            stats[category] += 1
+            stats['total'] += 1
         else:
-            try:
-                shutil.move(file_path, dest_path)
-                logger.info(f"✅ Moved: {filename} -> {category}/")
-            except Exception as e:
-                logger.error(f"❌ Failed to move {filename}: {e}")
-                stats['skipped'] += 1
-                continue
-
-        stats[category] += 1
-        stats['total'] += 1
+            moves.append((filename, file_path, dest_path, category))
+
+    # Second pass: perform the moves in parallel. Each move is an
+    # I/O-latency-bound syscall, so threads overlap the waiting.
+    if moves:
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_move_file, file_path, dest_path): (filename, category)
+                for filename, file_path, dest_path, category in moves
+            }
+            for future in as_completed(futures):
+                filename, category = futures[future]
+                try:
+                    future.result()
+                    logger.info(f"✅ Moved: {filename} -> {category}/")
+                    stats[category] += 1
+                    stats['total'] += 1
+                except Exception as e:
+                    logger.error(f"❌ Failed to move {filename}: {e}")
+                    stats['skipped'] += 1
 
     return stats
 
@@ -128,6 +244,9 @@ def main():
                         help='Simulate organization without making changes')
     parser.add_argument('--recursive', '-r', action='store_true',
                         help='Organize subdirectories recursively')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Threads used to move files in parallel '
+                             '(default: min(32, cpu_count * 4))')
 
     args = parser.parse_args()
 
@@ -141,25 +260,32 @@ def main():
 
     # Single directory organization
     if not args.recursive:
-        stats = organize_files(args.directory, args.dry_run)
+        stats = organize_files(args.directory, args.dry_run, max_workers=args.workers)
     else:
         # Recursive organization
         stats = {category: 0 for category in FILE_CATEGORIES}
         stats['total'] = 0
         stats['skipped'] = 0
 
-        for root, dirs, files in os.walk(args.directory):
-            # Skip category folders
-            if any(folder in FILE_CATEGORIES for folder in root.split(os.sep)):
-                continue
-
-            logger.info(f"\n🔍 Processing directory: {root}")
-            dir_stats = organize_files(root, args.dry_run)
-
-            # Aggregate statistics
-            for key, value in dir_stats.items():
-                if key in stats:
-                    stats[key] += value
+        # The walk prunes category folders before descending, so only the
+        # starting directory itself needs the path-component check; no
+        # per-directory path splitting inside the loop
+        if not _CATEGORY_NAMES.isdisjoint(args.directory.split(os.sep)):
+            logger.warning(f"⚠️ {args.directory} is inside a category folder, "
+                           "nothing to organize")
+        else:
+            for root, dirs, files in scandir_walk(args.directory):
+                # Don't descend into the category folders we create
+                dirs[:] = [d for d in dirs if d.name not in _CATEGORY_NAMES]
+
+                logger.info(f"\n🔍 Processing directory: {root}")
+                dir_stats = organize_files(root, args.dry_run, entries=files,
+                                           max_workers=args.workers)
+
+                # Aggregate statistics
+                for key, value in dir_stats.items():
+                    if key in stats:
+                        stats[key] += value
 
     duration = datetime.now() - start_time
 